@@ -2,19 +2,153 @@
 Pivot Timing Analysis: X-Axis Wavelength Comparison
 Compares current distance from last pivot to historical average wavelengths
 """
+import math
+from collections import OrderedDict
+from threading import Lock
+
 import numpy as np
-import talib
+from numba import njit
 from scipy.signal import find_peaks
 
+_HT_DCPERIOD_LOOKBACK = 32
+_HT_LOOKBACK = 63
+_SMOOTH_PRICE_SIZE = 50
+_HT_STATE_SIZE = 15
+_CYCLE_CACHE_SIZE = 8
+
+_cycle_cache = OrderedDict()
+_cycle_cache_lock = Lock()
+
+
+@njit('i8[::1](f8[::1])', nogil=True, cache=True)
+def _local_maxima(x):
+    """Strict local maxima; a flat top resolves to its middle bar (as in scipy)."""
+    n = len(x)
+    peaks = np.empty(n // 2 + 1, dtype=np.int64)
+    m = 0
+    i = 1
+    while i < n - 1:
+        if x[i - 1] < x[i]:
+            ahead = i + 1
+            while ahead < n - 1 and x[ahead] == x[i]:
+                ahead += 1
+            if x[ahead] < x[i]:
+                peaks[m] = (i + ahead - 1) // 2
+                m += 1
+                i = ahead
+        i += 1
+    return peaks[:m]
+
+
+@njit('i8[::1](i8[::1], i8[::1], i8)', nogil=True, cache=True)
+def _thin_by_distance(peaks, order, distance):
+    """Keep peaks from highest down, dropping any within `distance` bars of a kept one."""
+    m = len(peaks)
+    keep = np.ones(m, dtype=np.bool_)
+    for r in range(m - 1, -1, -1):
+        j = order[r]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < m and peaks[k] - peaks[j] < distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
+
+
+def _simple_peaks(x: np.ndarray, distance: float) -> np.ndarray:
+    """
+    Same indices as scipy.signal.find_peaks(x, distance=distance), without
+    the prominence/width pipeline that find_peaks runs and then discards.
+    """
+    if distance < 1:
+        raise ValueError('`distance` must be greater or equal to 1')
+    distance = math.ceil(distance)  # as find_peaks does
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    peaks = _local_maxima(x)
+    return _thin_by_distance(peaks, np.argsort(x[peaks]), distance)
+
 
 def detect_pivots(highs: np.ndarray, lows: np.ndarray, 
                   prominence: float = None, distance: int = 5):
-    """Detect swing highs and lows using scipy signal processing."""
+    """Detect swing highs and lows (scipy find_peaks semantics)."""
+    if prominence is None:
+        return _simple_peaks(highs, distance), _simple_peaks(-lows, distance)
     peak_indices, _ = find_peaks(highs, prominence=prominence, distance=distance)
     valley_indices, _ = find_peaks(-lows, prominence=prominence, distance=distance)
     return peak_indices, valley_indices
 
 
+def detect_pivots_vectorized(highs: np.ndarray, lows: np.ndarray, distance: int = 5):
+    """
+    Detect swing highs/lows as strict extremes within +/- distance bars.
+    
+    One linear pass of array comparisons over the whole series, so a backtest
+    can compute it once up front instead of calling detect_pivots every bar.
+    A pivot at index i is only confirmed at bar i + distance, so when replaying
+    bar t use the pivots with index <= t - distance.
+    """
+    n = len(highs)
+    is_peak = np.zeros(n, dtype=bool)
+    is_valley = np.zeros(n, dtype=bool)
+    
+    if distance < 1 or n <= 2 * distance:
+        return np.flatnonzero(is_peak), np.flatnonzero(is_valley)
+    
+    is_peak[distance:-distance] = True
+    is_valley[distance:-distance] = True
+    mid = slice(distance, n - distance)
+    for d in range(1, distance + 1):
+        left = slice(distance - d, n - distance - d)
+        right = slice(distance + d, n - distance + d)
+        is_peak[mid] &= (highs[mid] > highs[left]) & (highs[mid] > highs[right])
+        is_valley[mid] &= (lows[mid] < lows[left]) & (lows[mid] < lows[right])
+    
+    return np.flatnonzero(is_peak), np.flatnonzero(is_valley)
+
+
+@njit('Tuple((f8, f8, f8, i8, f8, f8, f8))(i8[::1], i8)', nogil=True, cache=True, fastmath=True)
+def _timing_kernel(pivot_indices, current_bar):
+    """
+    Single pass over pivot_indices computing every timing statistic.
+    Returns (avg, std, median, current_distance, z_score, percentile, bars_until_avg).
+    """
+    n = len(pivot_indices) - 1
+    wl = np.empty(n, dtype=np.float64)
+    current_distance = current_bar - pivot_indices[-1]
+    
+    s = 0.0
+    s2 = 0.0
+    cnt_le = 0
+    for i in range(n):
+        w = pivot_indices[i + 1] - pivot_indices[i]
+        wl[i] = w
+        s += w
+        s2 += w * w
+        if w <= current_distance:
+            cnt_le += 1
+    
+    avg = s / n
+    std = np.sqrt(max(s2 / n - avg * avg, 0.0))
+    
+    mid = n // 2
+    part = np.partition(wl, mid)
+    if n % 2 == 1:
+        median = part[mid]
+    else:
+        median = (part[mid] + np.max(part[:mid])) / 2
+    
+    z_score = (current_distance - avg) / std if std > 0 else 0.0
+    percentile = cnt_le / n * 100
+    bars_until_avg = max(0.0, avg - current_distance)
+    
+    return avg, std, median, current_distance, z_score, percentile, bars_until_avg
+
+
 def wavelength_timing_analysis(pivot_indices: np.ndarray, current_bar: int):
     """
     X-AXIS ANALYSIS: Compare current timing to historical wavelengths.
@@ -24,23 +158,20 @@ def wavelength_timing_analysis(pivot_indices: np.ndarray, current_bar: int):
     if len(pivot_indices) < 3:
         return None
     
-    # Calculate historical wavelengths (distances between consecutive pivots)
-    wavelengths = np.diff(pivot_indices)
+    pivot_indices = np.ascontiguousarray(pivot_indices, dtype=np.int64)
     
-    # Statistical measures
-    avg_wavelength = np.mean(wavelengths)
-    std_wavelength = np.std(wavelengths)
-    median_wavelength = np.median(wavelengths)
-    
-    # Current distance from last pivot
-    current_distance = current_bar - pivot_indices[-1]
-    
-    # Z-score: how many standard deviations from average
-    z_score = (current_distance - avg_wavelength) / std_wavelength if std_wavelength > 0 else 0
-    
-    # Percentile: what % of historical wavelengths were shorter than current distance
-    percentile = np.mean(wavelengths <= current_distance) * 100
+    # Wavelengths (distances between consecutive pivots), mean/std/median,
+    # z-score and percentile are all computed in one compiled pass
+    (avg_wavelength, std_wavelength, median_wavelength, current_distance,
+     z_score, percentile, bars_until_avg) = _timing_kernel(pivot_indices, current_bar)
     
+    return _timing_result(avg_wavelength, std_wavelength, median_wavelength,
+                          current_distance, z_score, percentile, bars_until_avg,
+                          np.diff(pivot_indices[-6:]))  # Last 5 for context, as an ndarray
+
+
+def _timing_result(avg_wavelength, std_wavelength, median_wavelength, current_distance,
+                   z_score, percentile, bars_until_avg, recent_wavelengths) -> dict:
     # Simple probability estimate based on historical distribution
     # Higher percentile = more likely we're at/past typical pivot timing
     timing_probability = min(percentile / 100, 1.0)
@@ -53,27 +184,366 @@ def wavelength_timing_analysis(pivot_indices: np.ndarray, current_bar: int):
         'z_score': z_score,
         'percentile': percentile,
         'timing_probability': timing_probability,
-        'bars_until_avg': max(0, avg_wavelength - current_distance),
-        'recent_wavelengths': wavelengths[-5:].tolist()  # Last 5 for context
+        'bars_until_avg': bars_until_avg,
+        'recent_wavelengths': recent_wavelengths
     }
 
 
-def cycle_analysis(close: np.ndarray):
+class WavelengthTracker:
+    """
+    Incremental version of wavelength_timing_analysis for backtest loops.
+    
+    Wavelengths are append-only, so they are kept sorted as pivots arrive:
+    the percentile becomes a binary search, the median an index lookup, and
+    mean/std are updated with Welford's method.
+    """
+
+    def __init__(self):
+        self.last_pivot = None
+        self.sorted_wavelengths = np.empty(0, dtype=np.int64)
+        self._recent = np.empty(0, dtype=np.int64)
+        self._recent.setflags(write=False)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add_pivot(self, index: int):
+        """Record a new pivot (must be newer than the previous one)."""
+        if self.last_pivot is not None:
+            if index <= self.last_pivot:
+                raise ValueError(f"pivot index {index} is not newer than the last pivot {self.last_pivot}")
+            w = index - self.last_pivot
+            pos = np.searchsorted(self.sorted_wavelengths, w)
+            self.sorted_wavelengths = np.insert(self.sorted_wavelengths, pos, w)
+            self._recent = np.append(self._recent[-4:], w)
+            # Returned to callers as-is by analyze(), so keep it read-only
+            self._recent.setflags(write=False)
+            
+            delta = w - self._mean
+            self._mean += delta / len(self.sorted_wavelengths)
+            self._m2 += delta * (w - self._mean)
+        self.last_pivot = index
+
+    def analyze(self, current_bar: int):
+        """Same result as wavelength_timing_analysis over all pivots added so far."""
+        n = len(self.sorted_wavelengths)
+        if n < 2:
+            return None
+        
+        avg_wavelength = self._mean
+        std_wavelength = np.sqrt(self._m2 / n)
+        mid = n // 2
+        if n % 2 == 1:
+            median_wavelength = float(self.sorted_wavelengths[mid])
+        else:
+            median_wavelength = (self.sorted_wavelengths[mid - 1] + self.sorted_wavelengths[mid]) / 2
+        
+        current_distance = current_bar - self.last_pivot
+        z_score = (current_distance - avg_wavelength) / std_wavelength if std_wavelength > 0 else 0
+        percentile = np.searchsorted(self.sorted_wavelengths, current_distance, side='right') / n * 100
+        
+        return _timing_result(avg_wavelength, std_wavelength, median_wavelength,
+                              current_distance, z_score, percentile,
+                              max(0, avg_wavelength - current_distance), self._recent)
+
+
+@njit('f8(i8, i8, f8, i8, f8, f8[:, :, ::1], f8[:, ::1], f8[:, ::1])', nogil=True, cache=True)
+def _hilbert(k, side, x, hilbert_idx, adjusted_prev_period, buf, prev, prev_input):
+    """One step of TA-Lib's Hilbert transform for state slot k, odd/even side."""
+    t = 0.0962 * x
+    out = -buf[k, side, hilbert_idx]
+    buf[k, side, hilbert_idx] = t
+    out += t
+    out -= prev[k, side]
+    prev[k, side] = 0.5769 * prev_input[k, side]
+    out += prev[k, side]
+    prev_input[k, side] = x
+    return out * adjusted_prev_period
+
+
+@njit('i8(f8[::1], i8, f8[::1])', nogil=True, cache=True)
+def _ht_period_init(close, wma_priming, st):
+    """
+    Prime TA-Lib's 4-bar WMA (weights 4,3,2,1) for `wma_priming` bars after
+    the first three (9 in HT_DCPERIOD, 34 in HT_DCPHASE/HT_SINE/HT_TRENDMODE)
+    and reset the period chain state in `st`. Returns the first bar to step.
+    """
+    st[:] = 0.0
+    wma_sub = close[0] + close[1] + close[2]
+    wma_sum = close[0] + close[1] * 2.0 + close[2] * 3.0
+    trailing_value = 0.0
+    trailing_idx = 0
+    today = 3
+    for _ in range(wma_priming):
+        v = close[today]
+        today += 1
+        wma_sub += v - trailing_value
+        wma_sum += v * 4.0
+        trailing_value = close[trailing_idx]
+        trailing_idx += 1
+        wma_sum -= wma_sub
+    st[0] = wma_sub
+    st[1] = wma_sum
+    st[2] = trailing_value
+    st[3] = trailing_idx
+    return today
+
+
+@njit('UniTuple(f8, 2)(f8[::1], i8, f8[::1], f8[:, :, ::1], f8[:, ::1], f8[:, ::1])',
+      nogil=True, cache=True)
+def _ht_period_step(close, today, st, buf, prev, prev_input):
+    """
+    Advance the WMA smoother + Hilbert dominant-period chain by one bar.
+    State lives in `st` and the Hilbert buffers; returns (smoothed price, smoothed period).
     """
-    Use TA-Lib Hilbert Transform for cycle detection.
-    This is THE reason to use TA-Lib - no other library has this.
+    wma_sub = st[0]
+    wma_sum = st[1]
+    trailing_value = st[2]
+    trailing_idx = int(st[3])
+    hilbert_idx = int(st[4])
+    period = st[5]
+    smooth_period = st[6]
+    prev_i2 = st[7]
+    prev_q2 = st[8]
+    re = st[9]
+    im = st[10]
+    i1_odd_prev2 = st[11]
+    i1_odd_prev3 = st[12]
+    i1_even_prev2 = st[13]
+    i1_even_prev3 = st[14]
+
+    adj = 0.075 * period + 0.54
+    v = close[today]
+    wma_sub += v - trailing_value
+    wma_sum += v * 4.0
+    trailing_value = close[trailing_idx]
+    trailing_idx += 1
+    smoothed = wma_sum * 0.1
+    wma_sum -= wma_sub
+
+    # Hilbert state: [detrender, Q1, jI, jQ] x [odd, even]
+    if today % 2 == 0:
+        detrender = _hilbert(0, 1, smoothed, hilbert_idx, adj, buf, prev, prev_input)
+        q1 = _hilbert(1, 1, detrender, hilbert_idx, adj, buf, prev, prev_input)
+        ji = _hilbert(2, 1, i1_even_prev3, hilbert_idx, adj, buf, prev, prev_input)
+        jq = _hilbert(3, 1, q1, hilbert_idx, adj, buf, prev, prev_input)
+        hilbert_idx += 1
+        if hilbert_idx == 3:
+            hilbert_idx = 0
+        q2 = 0.2 * (q1 + ji) + 0.8 * prev_q2
+        i2 = 0.2 * (i1_even_prev3 - jq) + 0.8 * prev_i2
+        i1_odd_prev3 = i1_odd_prev2
+        i1_odd_prev2 = detrender
+    else:
+        detrender = _hilbert(0, 0, smoothed, hilbert_idx, adj, buf, prev, prev_input)
+        q1 = _hilbert(1, 0, detrender, hilbert_idx, adj, buf, prev, prev_input)
+        ji = _hilbert(2, 0, i1_odd_prev3, hilbert_idx, adj, buf, prev, prev_input)
+        jq = _hilbert(3, 0, q1, hilbert_idx, adj, buf, prev, prev_input)
+        q2 = 0.2 * (q1 + ji) + 0.8 * prev_q2
+        i2 = 0.2 * (i1_odd_prev3 - jq) + 0.8 * prev_i2
+        i1_even_prev3 = i1_even_prev2
+        i1_even_prev2 = detrender
+
+    re = 0.2 * (i2 * prev_i2 + q2 * prev_q2) + 0.8 * re
+    im = 0.2 * (i2 * prev_q2 - q2 * prev_i2) + 0.8 * im
+    prev_q2 = q2
+    prev_i2 = i2
+    last_period = period
+    if im != 0.0 and re != 0.0:
+        period = 360.0 / (np.arctan(im / re) * (180.0 / np.pi))
+    if period > 1.5 * last_period:
+        period = 1.5 * last_period
+    if period < 0.67 * last_period:
+        period = 0.67 * last_period
+    if period < 6:
+        period = 6.0
+    elif period > 50:
+        period = 50.0
+    period = 0.2 * period + 0.8 * last_period
+    smooth_period = 0.33 * period + 0.67 * smooth_period
+
+    st[0] = wma_sub
+    st[1] = wma_sum
+    st[2] = trailing_value
+    st[3] = trailing_idx
+    st[4] = hilbert_idx
+    st[5] = period
+    st[6] = smooth_period
+    st[7] = prev_i2
+    st[8] = prev_q2
+    st[9] = re
+    st[10] = im
+    st[11] = i1_odd_prev2
+    st[12] = i1_odd_prev3
+    st[13] = i1_even_prev2
+    st[14] = i1_even_prev3
+    return smoothed, smooth_period
+
+
+@njit('Tuple((f8[::1], f8[::1], f8[::1], f8[::1], i8[::1]))(f8[::1], i8)', nogil=True, cache=True)
+def _ht_all(close, tail):
     """
-    # Dominant Cycle Period - estimated current cycle length
-    dc_period = talib.HT_DCPERIOD(close)
+    Numba port of TA-Lib's Hilbert Transform pipeline, producing
+    HT_DCPERIOD, HT_DCPHASE, HT_SINE (sine, leadsine) and HT_TRENDMODE
+    in one pass instead of four.
     
-    # Dominant Cycle Phase - where we are in the cycle (0-360 degrees)
-    dc_phase = talib.HT_DCPHASE(close)
+    Only the last `tail` bars are allocated and written (pass len(close) for
+    full arrays); the chains themselves keep O(1) state. As in TA-Lib, the
+    dominant period starts after a 32-bar lookback and the other outputs after
+    63 bars; earlier bars are NaN (0 for trend mode). The period comes from a
+    chain primed like HT_DCPERIOD, the phase-based outputs from one primed
+    like HT_DCPHASE.
+    """
+    n = len(close)
+    tail = min(tail, n)
+    first_out = n - tail
+    dcperiod = np.full(tail, np.nan)
+    dcphase = np.full(tail, np.nan)
+    sine_out = np.full(tail, np.nan)
+    leadsine_out = np.full(tail, np.nan)
+    trendmode = np.zeros(tail, dtype=np.int64)
+    if n <= _HT_DCPERIOD_LOOKBACK:
+        return dcperiod, dcphase, sine_out, leadsine_out, trendmode
+
+    deg2rad = np.pi / 180.0
+
+    # HT_DCPERIOD chain
+    period_st = np.zeros(_HT_STATE_SIZE)
+    period_buf = np.zeros((4, 2, 3))
+    period_prev = np.zeros((4, 2))
+    period_prev_input = np.zeros((4, 2))
+    period_start = _ht_period_init(close, 9, period_st)
+
+    # HT_DCPHASE/HT_SINE/HT_TRENDMODE chain
+    phase_st = np.zeros(_HT_STATE_SIZE)
+    phase_buf = np.zeros((4, 2, 3))
+    phase_prev = np.zeros((4, 2))
+    phase_prev_input = np.zeros((4, 2))
+    phase_start = n
+    if n > _HT_LOOKBACK:
+        phase_start = _ht_period_init(close, 34, phase_st)
+
+    smooth_price = np.zeros(_SMOOTH_PRICE_SIZE)
+    sp_idx = 0
+    dc_phase = 0.0
+    sine = 0.0
+    leadsine = 0.0
+    itrend1 = 0.0
+    itrend2 = 0.0
+    itrend3 = 0.0
+    days_in_trend = 0
+
+    for today in range(period_start, n):
+        _, dc_period = _ht_period_step(close, today, period_st, period_buf,
+                                       period_prev, period_prev_input)
+        if today >= _HT_DCPERIOD_LOOKBACK and today >= first_out:
+            dcperiod[today - first_out] = dc_period
+        if today < phase_start:
+            continue
+
+        smoothed, smooth_period = _ht_period_step(close, today, phase_st, phase_buf,
+                                                  phase_prev, phase_prev_input)
+        smooth_price[sp_idx] = smoothed
+
+        # Dominant cycle phase
+        prev_dc_phase = dc_phase
+        dc_period_int = int(smooth_period + 0.5)
+        real_part = 0.0
+        imag_part = 0.0
+        idx = sp_idx
+        for i in range(dc_period_int):
+            angle = i * 2.0 * np.pi / dc_period_int
+            real_part += np.sin(angle) * smooth_price[idx]
+            imag_part += np.cos(angle) * smooth_price[idx]
+            idx = _SMOOTH_PRICE_SIZE - 1 if idx == 0 else idx - 1
+        if abs(imag_part) > 0.0:
+            dc_phase = np.arctan(real_part / imag_part) * (180.0 / np.pi)
+        elif abs(imag_part) <= 0.01:
+            if real_part < 0.0:
+                dc_phase -= 90.0
+            elif real_part > 0.0:
+                dc_phase += 90.0
+        dc_phase += 90.0
+        dc_phase += 360.0 / smooth_period
+        if imag_part < 0.0:
+            dc_phase += 180.0
+        if dc_phase > 315.0:
+            dc_phase -= 360.0
+
+        prev_sine = sine
+        prev_leadsine = leadsine
+        sine = np.sin(dc_phase * deg2rad)
+        leadsine = np.sin((dc_phase + 45.0) * deg2rad)
+
+        # Instantaneous trendline
+        mean_price = 0.0
+        for i in range(dc_period_int):
+            mean_price += close[today - i]
+        if dc_period_int > 0:
+            mean_price /= dc_period_int
+        trendline = (4.0 * mean_price + 3.0 * itrend1 + 2.0 * itrend2 + itrend3) / 10.0
+        itrend3 = itrend2
+        itrend2 = itrend1
+        itrend1 = mean_price
+
+        trend = 1
+        if (sine > leadsine and prev_sine <= prev_leadsine) or \
+                (sine < leadsine and prev_sine >= prev_leadsine):
+            days_in_trend = 0
+            trend = 0
+        days_in_trend += 1
+        if days_in_trend < 0.5 * smooth_period:
+            trend = 0
+        phase_change = dc_phase - prev_dc_phase
+        if smooth_period != 0.0 and 0.67 * 360.0 / smooth_period < phase_change < 1.5 * 360.0 / smooth_period:
+            trend = 0
+        if trendline != 0.0 and abs((smooth_price[sp_idx] - trendline) / trendline) >= 0.015:
+            trend = 1
+
+        if today >= _HT_LOOKBACK and today >= first_out:
+            o = today - first_out
+            dcphase[o] = dc_phase
+            sine_out[o] = sine
+            leadsine_out[o] = leadsine
+            trendmode[o] = trend
+
+        sp_idx += 1
+        if sp_idx == _SMOOTH_PRICE_SIZE:
+            sp_idx = 0
+
+    return dcperiod, dcphase, sine_out, leadsine_out, trendmode
+
+
+def cycle_analysis(close: np.ndarray):
+    """
+    Hilbert Transform cycle detection (TA-Lib's HT_* indicators).
+    All four indicators share one compiled pass; only the last two bars are kept.
     
-    # Sine wave representation of cycle
-    sine, leadsine = talib.HT_SINE(close)
+    Results are cached on (buffer address, length, stride, dtype, last close),
+    so repeat calls on the same array within a bar (e.g. several strategies)
+    return immediately. Each entry holds a reference to its array and only
+    hits for that same object, so a new array at a reused address is never
+    served a stale result. Mutating values in place is not detected.
+    """
+    key = (close.ctypes.data, close.size, close.strides[0], close.dtype, float(close[-1]))
+    with _cycle_cache_lock:
+        entry = _cycle_cache.get(key)
+        if entry is not None and entry[0] is close:
+            _cycle_cache.move_to_end(key)
+            return dict(entry[1])
     
-    # Trend vs Cycle mode (1 = trending, 0 = cycling)
-    trend_mode = talib.HT_TRENDMODE(close)
+    # Computed outside the lock; the kernel releases the GIL for other threads
+    result = _cycle_analysis(np.ascontiguousarray(close, dtype=np.float64))
+    with _cycle_cache_lock:
+        _cycle_cache[key] = (close, result)
+        _cycle_cache.move_to_end(key)
+        if len(_cycle_cache) > _CYCLE_CACHE_SIZE:
+            _cycle_cache.popitem(last=False)
+    return dict(result)
+
+
+def _cycle_analysis(close: np.ndarray) -> dict:
+    # Dominant cycle period/phase, sine wave, and trend mode (1 = trending, 0 = cycling)
+    dc_period, dc_phase, sine, leadsine, trend_mode = _ht_all(close, 2)
     
     return {
         'dominant_period': dc_period[-1],      # Current estimated cycle length in bars
@@ -112,10 +582,10 @@ if __name__ == "__main__":
         print(f"  Z-score: {timing['z_score']:.2f}")
         print(f"  Percentile: {timing['percentile']:.1f}%")
         print(f"  Timing probability: {timing['timing_probability']:.2%}")
-        print(f"  Recent wavelengths: {timing['recent_wavelengths']}")
+        print(f"  Recent wavelengths: {timing['recent_wavelengths'].tolist()}")
     
     # Cycle analysis
-    print("\n=== TA-Lib Cycle Analysis ===")
+    print("\n=== Hilbert Transform Cycle Analysis ===")
     cycles = cycle_analysis(close)
     print(f"  Dominant period: {cycles['dominant_period']:.1f} bars")
     print(f"  Current phase: {cycles['phase']:.1f}°")
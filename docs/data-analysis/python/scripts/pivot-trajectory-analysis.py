@@ -2,56 +2,207 @@
 Pivot Trajectory Analysis: Y-Axis Price Alignment
 Compares current price to trendline of previous pivots to estimate pivot probability
 """
+import importlib
 import numpy as np
-from scipy.signal import find_peaks
-from scipy import stats
+from numba import njit
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from operator import attrgetter
+from typing import Dict, List, Tuple, Optional
 
+# Peak detection lives in the timing script; its file name has dashes, so it
+# is loaded with import_module rather than an import statement. This directory
+# is on sys.path when this script is run directly; importers add it themselves
+timing = importlib.import_module('pivot-timing-analysis')
 
-@dataclass
+MAX_PIVOTS = 1024
+WINDOW_EDGE = 4  # distances past a detection window's start before its pivots are trusted
+CONFIDENCE_LABELS = np.array(['low', 'medium', 'high'])
+
+
+@dataclass(slots=True, frozen=True)
 class PivotPoint:
     index: int
     price: float
     is_high: bool
 
 
+@dataclass
+class PivotArray:
+    """
+    Pivots stored as parallel arrays (struct-of-arrays), sorted by index.
+    Filtering highs/lows is a boolean mask instead of a Python loop.
+    """
+    indices: np.ndarray   # int64
+    prices: np.ndarray    # float64
+    is_high: np.ndarray   # bool
+
+    @classmethod
+    def from_points(cls, points: List[PivotPoint]) -> "PivotArray":
+        points = sorted(points, key=attrgetter('index'))
+        return cls(
+            indices=np.array([p.index for p in points], dtype=np.int64),
+            prices=np.array([p.price for p in points], dtype=np.float64),
+            is_high=np.array([p.is_high for p in points], dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+class PivotBuffer:
+    """
+    Pre-allocated pivot storage for live/backtest loops.
+    
+    Each bar, pass the latest detector output to extend(). Only the recent end
+    of the buffer is rewritten, so sorted order is kept without re-sorting.
+    When the buffer fills up, the oldest half is dropped.
+    """
+
+    def __init__(self, capacity: int = MAX_PIVOTS):
+        self.capacity = capacity
+        self.count = 0
+        self._indices = np.empty(capacity, dtype=np.int64)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._is_high = np.empty(capacity, dtype=bool)
+
+    def extend(self, pivots: PivotArray, since: int = 0, distance: int = 5) -> int:
+        """
+        Sync the buffer with detector output. Returns how many pivots were written.
+        
+        `pivots` is detect_pivots_with_prices output over bars `since` onward
+        (0 = full history), found with the given `distance`. A newer bar can
+        thin out a recent pivot (or bring back one it had thinned), so stored
+        pivots are compared with the new output over the range both cover, and
+        everything from the first difference on is replaced.
+        
+        A window that starts after bar 0 is wrong near its left edge: its first
+        bar can't be a pivot, and pivots before it no longer thin out the ones
+        just after it, which then thin out others further in. With since > 0 the
+        output is only trusted from WINDOW_EDGE distances past `since`; stored
+        pivots before that are kept as they are and new ones within `distance`
+        of them are dropped. Thinning is greedy over the whole series, so a
+        window can still rarely disagree with full-history detection further in.
+        """
+        start = 0
+        if self.count:
+            # Align stored and new pivots on the first bar both cover
+            first = max(self._indices[0], since + WINDOW_EDGE * distance if since else 0)
+            lo = np.searchsorted(self._indices[:self.count], first)
+            if since and lo:
+                # Frozen pivots keep their place: drop new ones too close to them
+                keep = np.ones(len(pivots), dtype=bool)
+                for side in (True, False):
+                    frozen = np.flatnonzero(self._is_high[:lo] == side)
+                    if len(frozen):
+                        last = self._indices[frozen[-1]]
+                        keep &= (pivots.is_high != side) | (pivots.indices >= last + distance)
+                pivots = PivotArray(pivots.indices[keep], pivots.prices[keep], pivots.is_high[keep])
+            start = np.searchsorted(pivots.indices, first)
+            overlap = min(self.count - lo, len(pivots) - start)
+            same = ((self._indices[lo:lo + overlap] == pivots.indices[start:start + overlap]) &
+                    (self._is_high[lo:lo + overlap] == pivots.is_high[start:start + overlap]) &
+                    (self._prices[lo:lo + overlap] == pivots.prices[start:start + overlap]))
+            diff = np.flatnonzero(~same)
+            k = diff[0] if len(diff) else overlap
+            # Stored pivots past the first difference are no longer reported
+            self.count = lo + k
+            start += k
+        new = len(pivots) - start
+        if new <= 0:
+            return 0
+        
+        if new > self.capacity:
+            start += new - self.capacity
+            new = self.capacity
+        if self.count + new > self.capacity:
+            keep = max(0, min(self.count, self.capacity // 2, self.capacity - new))
+            for arr in (self._indices, self._prices, self._is_high):
+                arr[:keep] = arr[self.count - keep:self.count]
+            self.count = keep
+        
+        end = self.count + new
+        self._indices[self.count:end] = pivots.indices[start:]
+        self._prices[self.count:end] = pivots.prices[start:]
+        self._is_high[self.count:end] = pivots.is_high[start:]
+        self.count = end
+        return new
+
+    def view(self) -> PivotArray:
+        """Stored pivots as a PivotArray of zero-copy views."""
+        return PivotArray(self._indices[:self.count],
+                          self._prices[:self.count],
+                          self._is_high[:self.count])
+
+
 def detect_pivots_with_prices(highs: np.ndarray, lows: np.ndarray, 
-                               distance: int = 5) -> List[PivotPoint]:
+                               distance: int = 5) -> PivotArray:
     """Detect pivots and return with price levels."""
-    peak_idx, _ = find_peaks(highs, distance=distance)
-    valley_idx, _ = find_peaks(-lows, distance=distance)
+    peak_idx, valley_idx = timing.detect_pivots(highs, lows, distance=distance)
+    
+    # Both index arrays are already sorted, so each pivot's merged position is
+    # its own rank plus the number of pivots from the other side before it
+    # (highs first when a bar is both)
+    peak_pos = np.arange(len(peak_idx)) + np.searchsorted(valley_idx, peak_idx, side='left')
+    valley_pos = np.arange(len(valley_idx)) + np.searchsorted(peak_idx, valley_idx, side='right')
     
-    pivots = []
-    for idx in peak_idx:
-        pivots.append(PivotPoint(idx, highs[idx], is_high=True))
-    for idx in valley_idx:
-        pivots.append(PivotPoint(idx, lows[idx], is_high=False))
+    n = len(peak_idx) + len(valley_idx)
+    indices = np.empty(n, dtype=np.int64)
+    prices = np.empty(n, dtype=np.float64)
+    is_high = np.empty(n, dtype=bool)
+    indices[peak_pos] = peak_idx
+    indices[valley_pos] = valley_idx
+    prices[peak_pos] = highs[peak_idx]
+    prices[valley_pos] = lows[valley_idx]
+    is_high[peak_pos] = True
+    is_high[valley_pos] = False
     
-    return sorted(pivots, key=lambda p: p.index)
+    return PivotArray(indices, prices, is_high)
 
 
-def fit_pivot_trendline(pivots: List[PivotPoint], is_high: bool, 
+@njit('UniTuple(f8, 3)(f8[::1], f8[::1])', nogil=True, cache=True)
+def _linregress_small(x, y):
+    """
+    Closed-form least squares for a handful of points.
+    Returns (slope, intercept, r_squared) without scipy's t-stats/p-values.
+    """
+    n = len(x)
+    xm = x.sum() / n
+    ym = y.sum() / n
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for i in range(n):
+        dx = x[i] - xm
+        dy = y[i] - ym
+        sxx += dx * dx
+        syy += dy * dy
+        sxy += dx * dy
+    
+    slope = sxy / sxx
+    intercept = ym - slope * xm
+    r_squared = (sxy * sxy) / (sxx * syy) if syy > 0 else 0.0
+    return slope, intercept, r_squared
+
+
+def fit_pivot_trendline(pivots: PivotArray, is_high: bool, 
                         lookback: int = 5) -> Optional[Tuple[float, float, float]]:
     """
     Fit a linear trendline through recent pivot highs or lows.
     Returns (slope, intercept, r_squared) or None if insufficient data.
     """
     # Filter to only highs or lows
-    filtered = [p for p in pivots if p.is_high == is_high][-lookback:]
+    idx = np.flatnonzero(pivots.is_high == is_high)[-lookback:]
     
-    if len(filtered) < 2:
+    if len(idx) < 2:
         return None
     
-    x = np.array([p.index for p in filtered])
-    y = np.array([p.price for p in filtered])
-    
-    slope, intercept, r_value, _, _ = stats.linregress(x, y)
+    x = pivots.indices[idx].astype(np.float64)
+    y = pivots.prices[idx].astype(np.float64)
     
-    return slope, intercept, r_value ** 2
+    return _linregress_small(x, y)
 
 
-def trajectory_alignment_analysis(pivots: List[PivotPoint], 
+def trajectory_alignment_analysis(pivots: PivotArray, 
                                    current_bar: int, 
                                    current_high: float,
                                    current_low: float,
@@ -65,46 +216,36 @@ def trajectory_alignment_analysis(pivots: List[PivotPoint],
     
     This generalizes that concept using linear regression on pivot sequences.
     """
-    results = {}
-    
-    # Analyze swing highs trajectory
-    high_trend = fit_pivot_trendline(pivots, is_high=True)
-    if high_trend:
-        slope, intercept, r_squared = high_trend
-        projected_high = slope * current_bar + intercept
-        deviation_pct = abs(current_high - projected_high) / projected_high * 100
-        
-        results['swing_high'] = {
-            'slope': slope,
-            'r_squared': r_squared,
-            'projected_price': projected_high,
-            'current_price': current_high,
-            'deviation_pct': deviation_pct,
-            'aligned': deviation_pct <= tolerance_pct,
-            'trend_direction': 'ascending' if slope > 0 else 'descending',
-            # Higher r² + lower deviation = higher probability
-            'alignment_score': r_squared * max(0, 1 - deviation_pct / tolerance_pct)
-        }
+    # Swing highs and lows are scored together as length-2 arrays: [high, low]
+    fits = (fit_pivot_trendline(pivots, is_high=True),
+            fit_pivot_trendline(pivots, is_high=False))
+    has_fit = np.array([f is not None for f in fits])
+    slopes, intercepts, r_squareds = np.array(
+        [f if f is not None else (np.nan, np.nan, np.nan) for f in fits]).T
+    currents = np.array([current_high, current_low], dtype=np.float64)
     
-    # Analyze swing lows trajectory
-    low_trend = fit_pivot_trendline(pivots, is_high=False)
-    if low_trend:
-        slope, intercept, r_squared = low_trend
-        projected_low = slope * current_bar + intercept
-        deviation_pct = abs(current_low - projected_low) / projected_low * 100
-        
-        results['swing_low'] = {
+    projected = slopes * current_bar + intercepts
+    deviation_pct = np.abs(currents - projected) / projected * 100
+    aligned = deviation_pct <= tolerance_pct
+    # Higher r² + lower deviation = higher probability
+    alignment_score = r_squareds * np.maximum(0, 1 - deviation_pct / tolerance_pct)
+    
+    columns = zip(('swing_high', 'swing_low'), has_fit, slopes.tolist(), r_squareds.tolist(),
+                  projected.tolist(), currents.tolist(), deviation_pct.tolist(),
+                  aligned.tolist(), alignment_score.tolist())
+    return {
+        key: {
             'slope': slope,
-            'r_squared': r_squared,
-            'projected_price': projected_low,
-            'current_price': current_low,
-            'deviation_pct': deviation_pct,
-            'aligned': deviation_pct <= tolerance_pct,
+            'r_squared': r2,
+            'projected_price': proj,
+            'current_price': cur,
+            'deviation_pct': dev,
+            'aligned': ok,
             'trend_direction': 'ascending' if slope > 0 else 'descending',
-            'alignment_score': r_squared * max(0, 1 - deviation_pct / tolerance_pct)
+            'alignment_score': score
         }
-    
-    return results
+        for key, fit, slope, r2, proj, cur, dev, ok, score in columns if fit
+    }
 
 
 def combined_pivot_probability(timing_analysis: dict, 
@@ -148,6 +289,25 @@ def combined_pivot_probability(timing_analysis: dict,
     }
 
 
+def combined_batch(timing_probs: np.ndarray, r_squareds: np.ndarray,
+                   alignment_scores: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized combined_pivot_probability over many (symbol, bar) rows.
+    
+    Same weights and confidence thresholds, but confidence is returned as
+    int8 codes (0 = low, 1 = medium, 2 = high); decode for reporting with
+    CONFIDENCE_LABELS[confidence].
+    """
+    tp = np.asarray(timing_probs, dtype=np.float64)
+    r2 = np.asarray(r_squareds, dtype=np.float64)
+    
+    combined_prob = tp * 0.4 + np.asarray(alignment_scores, dtype=np.float64) * 0.6
+    confidence = np.where((r2 > 0.8) & (tp > 0.6), 2,
+                          np.where((r2 > 0.5) & (tp > 0.4), 1, 0)).astype(np.int8)
+    
+    return {'probability': combined_prob, 'confidence': confidence}
+
+
 # Example demonstrating your specific scenario
 if __name__ == "__main__":
     print("=== Y-AXIS: Trajectory Alignment Analysis ===\n")
@@ -157,13 +317,13 @@ if __name__ == "__main__":
     #  and current price is two points higher than that"
     
     # Simulating: lows at 100, 102, and current at 104
-    example_pivots = [
+    example_pivots = PivotArray.from_points([
         PivotPoint(index=10, price=105, is_high=True),
         PivotPoint(index=20, price=100, is_high=False),  # First low
         PivotPoint(index=30, price=108, is_high=True),
         PivotPoint(index=40, price=102, is_high=False),  # Second low (+2)
         PivotPoint(index=50, price=110, is_high=True),
-    ]
+    ])
     
     current_bar = 60
     current_low = 104  # Exactly +2 from last low - should align!
@@ -191,4 +351,12 @@ if __name__ == "__main__":
     print(f"  Overall probability: {combined['probability']:.2%}")
     print(f"  Confidence: {combined['confidence']}")
     print(f"  Timing contribution: {combined['timing_contribution']:.2%}")
-    print(f"  Trajectory contribution: {combined['trajectory_contribution']:.3f}")
\ No newline at end of file
+    print(f"  Trajectory contribution: {combined['trajectory_contribution']:.3f}")
+    
+    # Scoring many (symbol, bar) rows at once
+    batch = combined_batch(np.array([0.75, 0.5, 0.2]),
+                           np.array([0.9, 0.6, 0.95]),
+                           np.array([1.0, 0.4, 0.8]))
+    print("\n=== BATCH SCORING ===")
+    for prob, conf in zip(batch['probability'], CONFIDENCE_LABELS[batch['confidence']]):
+        print(f"  {prob:.2%} ({conf})")
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Tests for pivot-trajectory-analysis.py
+Run from this directory with: python -m pytest
+"""
+import importlib
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+trajectory = importlib.import_module('pivot-trajectory-analysis')
+
+
+def _random_walk(n_bars: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(n_bars) * 0.5)
+    high = close + np.abs(rng.standard_normal(n_bars) * 0.3)
+    low = close - np.abs(rng.standard_normal(n_bars) * 0.3)
+    return high, low
+
+
+def _stream(high, low, capacity, distance=5):
+    """Feed the buffer full-history detection bar by bar, checking it against each bar."""
+    buffer = trajectory.PivotBuffer(capacity)
+    for bar in range(1, len(high) + 1):
+        full = trajectory.detect_pivots_with_prices(high[:bar], low[:bar], distance)
+        buffer.extend(full)
+        stored = buffer.view()
+        n = len(stored)
+        assert n <= capacity
+        assert np.array_equal(stored.indices, full.indices[len(full) - n:])
+        assert np.array_equal(stored.prices, full.prices[len(full) - n:])
+        assert np.array_equal(stored.is_high, full.is_high[len(full) - n:])
+    return buffer, full
+
+
+def test_streamed_buffer_matches_full_history_detection():
+    high, low = _random_walk(2000)
+    buffer, full = _stream(high, low, capacity=2000)
+    assert buffer.count == len(full)
+
+
+def test_streamed_buffer_keeps_newest_pivots_when_full():
+    high, low = _random_walk(2000, seed=1)
+    buffer, full = _stream(high, low, capacity=64)
+    assert 32 <= buffer.count <= 64
+
+
+def test_streamed_buffer_has_no_pivots_closer_than_distance():
+    high, low = _random_walk(2000, seed=2)
+    buffer, _ = _stream(high, low, capacity=2000, distance=5)
+    stored = buffer.view()
+    for is_high in (True, False):
+        assert np.all(np.diff(stored.indices[stored.is_high == is_high]) >= 5)
+
+
+def test_sliding_window_keeps_pivots_that_left_the_window():
+    high, low = _random_walk(2000, seed=3)
+    buffer = trajectory.PivotBuffer(2000)
+    for bar in range(1, len(high) + 1):
+        since = max(0, bar - 120)
+        window = trajectory.detect_pivots_with_prices(high[since:bar], low[since:bar], 5)
+        shifted = trajectory.PivotArray(window.indices + since, window.prices, window.is_high)
+        buffer.extend(shifted, since, distance=5)
+    stored = buffer.view()
+    full = trajectory.detect_pivots_with_prices(high, low, 5)
+    # Greedy thinning near a window's left edge can still rarely differ
+    matched = len(np.intersect1d(stored.indices * 2 + stored.is_high,
+                                 full.indices * 2 + full.is_high))
+    assert matched >= 0.99 * len(full)
+    assert len(stored) - matched <= 0.01 * len(full)
+    for is_high in (True, False):
+        assert np.all(np.diff(stored.indices[stored.is_high == is_high]) >= 5)